@@ -14,54 +14,593 @@ Features:
 
 import sqlite3
 import csv
+import codecs
+import io
+import math
 import os
+import re
 import logging
+import atexit
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from array import array
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from contextlib import closing
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Iterator, Optional, TextIO, Tuple
 import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
 
+# apsw is optional; it binds parameters with less overhead than sqlite3
+try:
+    import apsw
+except ImportError:
+    apsw = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+
+def _make_log_handlers() -> List[logging.Handler]:
+    """Create the log file and console handlers."""
+    handlers = [
         logging.FileHandler('csv_import.log'),
         logging.StreamHandler()
     ]
-)
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    return handlers
+
+
+# Configure logging; records are queued and written by a listener thread,
+# so file and console writes don't block the import
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_make_log_handlers())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between progress messages during an import
+PROGRESS_LOG_INTERVAL = 5.0
+
+# Rows bound into each multi-row INSERT statement
+ROWS_PER_INSERT = 100
+
+# Maximum number of bound parameters per statement (raised in SQLite 3.32),
+# used when the connection cannot report its own limit
+MAX_SQL_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+# Errors raised by the available database drivers
+_DB_ERRORS = (sqlite3.Error, apsw.Error) if apsw is not None else (sqlite3.Error,)
+
+# Leading data rows sampled to infer column types
+TYPE_SAMPLE_ROWS = 100
+
+# Read buffer size for CSV files
+READ_BUFFER_SIZE = 1 << 20
+
+# Parsed batches queued ahead of the inserts
+PREFETCH_BATCHES = 4
+
+# Bytes scanned to decide whether a file can be bulk loaded by SQLite
+BULK_SCAN_BYTES = 64 * 1024
+
+# Quotes or non-ASCII bytes rule out the bulk load path
+_UNCLEAN_CSV_BYTES = re.compile(rb'["\x80-\xff]')
+
+# False positive rate of the duplicate detection Bloom filter
+DEDUP_ERROR_RATE = 0.01
+
+# Possible duplicates held back before they are verified in one query
+DEDUP_VERIFY_ROWS = 50000
+
+# Maps every ASCII character not allowed in a column name to an underscore
+_SANITIZE_TABLE = {
+    code: '_' for code in range(128)
+    if not (chr(code).isalnum() or chr(code) == '_')
+}
+
+# Non-ASCII characters that are not alphanumeric (ASCII is handled above)
+_NON_ASCII_SPECIAL = re.compile(r'[^\w\x00-\x7f]')
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_identifier(name: str) -> str:
+    """Sanitize a column or table name; see sanitize_column_name."""
+    # Replace spaces and special characters with underscores
+    sanitized = _NON_ASCII_SPECIAL.sub('_', name.strip().translate(_SANITIZE_TABLE))
+    # Ensure it doesn't start with a number
+    if sanitized and sanitized[0].isdigit():
+        sanitized = 'col_' + sanitized
+    return sanitized.lower()
+
+
+def _split_lines(lines: List[str]) -> Iterator[List[str]]:
+    """Split unquoted CSV lines into fields."""
+    return map(str.split, map(str.rstrip, lines, repeat('\r\n')), repeat(','))
+
+
+def _row_blocks(csvfile: TextIO) -> Iterator[Iterator[List[str]]]:
+    """Yield row iterators for successive blocks; see _block_csv_reader."""
+    for lines in iter(lambda: csvfile.readlines(READ_BUFFER_SIZE), []):
+        if '"' in ''.join(lines):
+            # A quoted field may hold commas or span lines; hand this block
+            # and the rest of the file to the csv module
+            yield csv.reader(chain(lines, csvfile))
+            return
+        yield _split_lines(lines)
+
+
+def _block_csv_reader(csvfile: TextIO) -> Iterator[List[str]]:
+    """
+    Read rows from a CSV file, splitting unquoted lines without the csv module.
+    
+    Lines are read in blocks and split by str.split through C-level maps,
+    which is faster than the csv module's quote-aware parser. Every comma
+    and line break in a block without '"' characters is a delimiter; from
+    the first block that has one, the file is parsed by csv.reader.
+    
+    Args:
+        csvfile: CSV file opened with newline=''
+        
+    Returns:
+        Iterator over rows, as csv.reader would return them
+    """
+    return chain.from_iterable(_row_blocks(csvfile))
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string as an SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a table or column name, so SQL keywords are valid names."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _read_batches(csv_reader: Iterator[List[str]], batch_size: int,
+                  ncols: int) -> Iterator[Tuple[List[List[str]], int, int]]:
+    """
+    Group parsed rows into batches, padded or truncated to the header width.
+    
+    Rows are pulled from the parser a chunk at a time instead of being
+    dispatched one by one, and empty rows are dropped.
+    
+    Args:
+        csv_reader: Parsed data rows
+        batch_size: Number of rows per batch
+        ncols: Number of columns in the header
+        
+    Returns:
+        Iterator of (batch, rows read, empty rows skipped) tuples
+    """
+    padding = [''] * ncols
+    full_width = {ncols}
+    batch = []
+    rows_read = empty_rows = 0
+    while True:
+        chunk = list(islice(csv_reader, batch_size - len(batch)))
+        if not chunk:
+            break
+        rows_read += len(chunk)
+        
+        # Skip empty rows
+        rows = list(filter(any, chunk))
+        empty_rows += len(chunk) - len(rows)
+        
+        # Chunks of full-width rows go in as parsed; otherwise pad short rows
+        # and truncate long ones, leaving full-width rows as they are
+        if set(map(len, rows)) <= full_width:
+            batch.extend(rows)
+        else:
+            batch.extend(row if len(row) == ncols else (row + padding)[:ncols]
+                         for row in rows)
+        
+        if len(batch) >= batch_size:
+            yield batch, rows_read, empty_rows
+            batch = []
+            rows_read = empty_rows = 0
+    if rows_read:
+        yield batch, rows_read, empty_rows
+
+
+def _prefetch(items: Iterator[Any], depth: int) -> Iterator[Any]:
+    """
+    Iterate over items produced by a background thread.
+    
+    Up to depth items are produced ahead, so producing the next items
+    overlaps with consuming the current one. Exceptions raised by the
+    producer are re-raised here. Closing the iterator stops the producer.
+    
+    Args:
+        items: Items to produce; must not contain None
+        depth: Maximum number of items queued ahead
+        
+    Returns:
+        Iterator over the items
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    
+    def put(item: Any) -> bool:
+        # Give up once the consumer has stopped, rather than block forever
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(None)
+        except Exception as e:
+            put(e)
+    
+    producer = threading.Thread(target=produce, name='csv-reader', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+
+# The affinity conversions below use Python's int() and float(), which accept
+# a few spellings SQLite keeps as text ('1_000', 'nan'). A mismatch only
+# costs a missed duplicate, never a wrongly skipped row, since every
+# duplicate is confirmed against the table.
+
+def _to_integer_affinity(value: str) -> Any:
+    """Convert text as SQLite does when storing it in an INTEGER column."""
+    try:
+        number = int(value)
+    except ValueError:
+        try:
+            number = float(value)
+        except ValueError:
+            return value
+        return int(number) if number.is_integer() and -2**63 < number < 2**63 else number
+    return number if -2**63 <= number < 2**63 else float(number)
+
+
+def _to_real_affinity(value: str) -> Any:
+    """Convert text as SQLite does when storing it in a REAL column."""
+    try:
+        # Adding 0.0 turns -0.0 into 0.0, which is what SQLite stores
+        return float(value) + 0.0
+    except ValueError:
+        return value
+
+
+def _affinity_converter(declared_type: str) -> Callable[[str], Any]:
+    """
+    Get the conversion SQLite applies to text stored in a column.
+    
+    Args:
+        declared_type: Declared column type
+        
+    Returns:
+        Function converting a text value to its stored value
+    """
+    declared_type = declared_type.upper()
+    if 'INT' in declared_type:
+        return _to_integer_affinity
+    if any(t in declared_type for t in ('CHAR', 'CLOB', 'TEXT')) or \
+            not declared_type or 'BLOB' in declared_type:
+        return str
+    if any(t in declared_type for t in ('REAL', 'FLOA', 'DOUB')):
+        return _to_real_affinity
+    return _to_integer_affinity
+
+
+# Builtins that convert a whole column at C speed when every value parses
+_COLUMN_CONVERTERS = {_to_integer_affinity: int, _to_real_affinity: float}
+
+
+def _convert_column(convert: Callable[[str], Any], values: Tuple[str, ...]) -> List[Any]:
+    """
+    Convert a column of text values with an affinity converter.
+    
+    Columns that parse as integers or reals throughout are converted by
+    int() or float() directly; otherwise every value goes through convert.
+    
+    Args:
+        convert: Affinity converter (see _affinity_converter)
+        values: Text values of the column
+        
+    Returns:
+        Converted values
+    """
+    builtin = _COLUMN_CONVERTERS.get(convert)
+    if builtin is not None:
+        try:
+            converted = list(map(builtin, values))
+        except ValueError:
+            pass
+        else:
+            # Integers outside 64 bits are stored as reals
+            if builtin is float or -2**63 <= min(converted) and max(converted) < 2**63:
+                return converted
+    return list(map(convert, values))
+
+
+class _BloomFilter:
+    """Blocked Bloom filter: each key sets seven bits of one 64-bit word."""
+    
+    def __init__(self, capacity: int, error_rate: float = DEDUP_ERROR_RATE):
+        """
+        Size the filter for the expected number of keys.
+        
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = max(capacity, 1)
+        # Keeping a key's bits in one word costs accuracy: with seven bits
+        # per 64-bit word, 1.35 times the bits of a standard Bloom filter
+        # measure just under a 1% false positive rate at capacity
+        num_bits = 1.35 * -self.capacity * math.log(error_rate) / math.log(2) ** 2
+        self.num_words = max(1, math.ceil(num_bits / 64))
+        self.words = array('Q', bytes(8 * self.num_words))
+        self.count = 0
+    
+    def add(self, key: int) -> bool:
+        """
+        Add a key to the filter.
+        
+        Args:
+            key: Hash of the key
+            
+        Returns:
+            True if the key may already have been present
+        """
+        # hash() of a tuple of small numbers leaves its upper bits poorly
+        # mixed, so finish it with MurmurHash3's 64-bit finalizer
+        key &= 0xFFFFFFFFFFFFFFFF
+        key ^= key >> 33
+        key = key * 0xFF51AFD7ED558CCD & 0xFFFFFFFFFFFFFFFF
+        key ^= key >> 33
+        key = key * 0xC4CEB9FE1A85EC53 & 0xFFFFFFFFFFFFFFFF
+        key ^= key >> 33
+        index = key % self.num_words
+        # Bit positions come from six-bit fields of the upper 42 bits
+        mask = (1 << (key >> 22 & 63) | 1 << (key >> 28 & 63) | 1 << (key >> 34 & 63) |
+                1 << (key >> 40 & 63) | 1 << (key >> 46 & 63) | 1 << (key >> 52 & 63) |
+                1 << (key >> 58))
+        word = self.words[index]
+        if word & mask == mask:
+            return True
+        self.words[index] = word | mask
+        self.count += 1
+        return False
+
+
+class _DuplicateFilter:
+    """
+    Detects rows already present in a table.
+    
+    Rows are probed against a Bloom filter seeded with the table's existing
+    rows, so new rows cost no database lookup. Filter hits may be false
+    positives; they are held back as candidates and verified against the
+    table together, in a single query.
+    """
+    
+    def __init__(self, conn: sqlite3.Connection, table: str, columns: List[str],
+                 expected_rows: int):
+        """
+        Build the filter from the rows already in the table.
+        
+        Args:
+            conn: Database connection
+            table: Sanitized table name
+            columns: Sanitized names of the columns compared
+            expected_rows: Estimated number of rows still to be imported
+        """
+        self.cursor = conn.cursor()
+        self.table = table
+        self.columns = columns
+        self.candidates = []
+        self.candidate_values = set()
+        self.skipped = 0
+        
+        # Keys are hashes of the values as stored, so incoming text is
+        # converted with each column's affinity first; text columns need
+        # no conversion
+        self.cursor.execute(f"PRAGMA table_info({_quote_identifier(table)})")
+        self.declared_types = {row[1]: row[2] for row in self.cursor.fetchall()}
+        self.conversions = [
+            (i, converter) for i, converter in enumerate(
+                _affinity_converter(self.declared_types.get(c, '')) for c in columns)
+            if converter is not str
+        ]
+        
+        # Leave room for the table to double, so a session adding many files
+        # to one table reseeds the filter only each time the table doubles
+        self.cursor.execute(f"SELECT count(*) FROM {_quote_identifier(table)}")
+        existing_rows = self.cursor.fetchone()[0]
+        self.bloom = _BloomFilter(2 * (existing_rows + expected_rows))
+        
+        self.cursor.execute(f"SELECT {', '.join(map(_quote_identifier, columns))} "
+                            f"FROM {_quote_identifier(table)}")
+        add = self.bloom.add
+        for key in map(hash, self.cursor):
+            add(key)
+        
+        logger.info(f"Duplicate filter for '{table}' seeded with {existing_rows} rows")
+    
+    def filter(self, rows: List[List[str]]) -> List[List[str]]:
+        """
+        Separate new rows from possible duplicates.
+        
+        Args:
+            rows: Rows to check, each with one value per compared column
+            
+        Returns:
+            Rows known not to be in the table; the rest are held back
+        """
+        if not rows:
+            return []
+        
+        # Convert and hash a column at a time, so the work runs in C. Rows
+        # are keyed by hash() of their tuple rather than by xxh3 or blake2b:
+        # those hash bytes, and encoding each converted row costs far more
+        # than hashing it. hash() is salted per process, which suits a filter
+        # rebuilt each session
+        columns = list(zip(*rows))
+        for i, convert in self.conversions:
+            columns[i] = _convert_column(convert, columns[i])
+        
+        new_rows = []
+        add = self.bloom.add
+        for row, key in zip(rows, map(hash, zip(*columns))):
+            if not add(key):
+                new_rows.append(row)
+                continue
+            # Rows repeated among the held back ones are duplicates either way
+            values = tuple(row)
+            if values in self.candidate_values:
+                self.skipped += 1
+            else:
+                self.candidate_values.add(values)
+                self.candidates.append(row)
+        return new_rows
+    
+    def verify(self) -> List[List[str]]:
+        """
+        Check the held back rows against the table.
+        
+        All rows passed to filter before must already be inserted.
+        
+        Returns:
+            Held back rows that are not in the table
+        """
+        if not self.candidates:
+            return []
+        
+        ncols = len(self.columns)
+        quoted_columns = [_quote_identifier(c) for c in self.columns]
+        definitions = ', '.join(f"{_quote_identifier(c)} {self.declared_types.get(c, '')}"
+                                for c in self.columns)
+        self.cursor.execute(
+            f"CREATE TEMP TABLE dedup_candidates (seq INTEGER PRIMARY KEY, {definitions})")
+        try:
+            self.cursor.executemany(
+                f"INSERT INTO temp.dedup_candidates VALUES (?{', ?' * ncols})",
+                ((i, *row) for i, row in enumerate(self.candidates))
+            )
+            
+            # Scan the table once, looking its rows up in an index of the
+            # candidates, rather than building a lookup of the whole table
+            self.cursor.execute(f"CREATE INDEX temp.dedup_candidates_values "
+                                f"ON dedup_candidates ({', '.join(quoted_columns)})")
+            matches = ' AND '.join(f"c.{c} = t.{c}" for c in quoted_columns)
+            self.cursor.execute(f"""
+            SELECT DISTINCT c.seq FROM main.{_quote_identifier(self.table)} AS t
+            CROSS JOIN temp.dedup_candidates AS c ON {matches}
+            """)
+            duplicates = {row[0] for row in self.cursor.fetchall()}
+        finally:
+            self.cursor.execute("DROP TABLE temp.dedup_candidates")
+        
+        new_rows = [row for i, row in enumerate(self.candidates) if i not in duplicates]
+        self.skipped += len(duplicates)
+        self.candidates = []
+        self.candidate_values = set()
+        return new_rows
+
 
 class InstrumentCSVImporter:
     """Handles importing instrument CSV data into SQL database."""
     
-    def __init__(self, db_path: str, batch_size: int = 1000):
+    def __init__(self, db_path: str, batch_size: int = 1000, workers: int = 1,
+                 backend: str = 'sqlite3'):
         """
         Initialize the importer.
         
         Args:
             db_path: Path to SQLite database file
             batch_size: Number of rows to insert per batch
+            workers: Number of processes for directory imports
+            backend: SQLite driver, 'sqlite3' or 'apsw'
         """
+        if backend not in ('sqlite3', 'apsw'):
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == 'apsw' and apsw is None:
+            raise ImportError("The apsw backend requires the apsw package")
         self.db_path = db_path
         self.batch_size = batch_size
+        self.workers = workers
+        self.backend = backend
         self.conn = None
         self.cursor = None
+        self.max_sql_variables = MAX_SQL_VARIABLES
+        self._csv_extension_loaded = None
+        self._duplicate_filters = {}
+        self._schema_cache = {}
         
     def connect(self):
         """Establish database connection."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            # Autocommit mode: transactions are managed explicitly in import_csv.
+            # A larger statement cache avoids re-preparing repeated statements
+            if self.backend == 'apsw':
+                self.conn = apsw.Connection(self.db_path, statementcachesize=256)
+            else:
+                self.conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                            cached_statements=256)
             self.cursor = self.conn.cursor()
+            self.max_sql_variables = self._variable_limit()
+            
+            # Tune for bulk loading: WAL with relaxed syncing avoids an fsync
+            # per commit, and the exclusive lock skips per-transaction locking
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA cache_size=-65536")
+            self.cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
             logger.info(f"Connected to database: {self.db_path}")
-        except sqlite3.Error as e:
+        except _DB_ERRORS as e:
             logger.error(f"Database connection failed: {e}")
             raise
     
+    def _variable_limit(self) -> int:
+        """
+        Get the connection's limit on bound parameters per statement.
+        
+        Builds may set their own limit, and apsw bundles its own SQLite, so
+        the limit is read from the connection where the driver allows it
+        (sqlite3 on Python 3.11+, apsw).
+        
+        Returns:
+            Maximum number of parameters in one statement
+        """
+        try:
+            if self.backend == 'apsw':
+                return self.conn.limit(apsw.SQLITE_LIMIT_VARIABLE_NUMBER)
+            return self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        except AttributeError:
+            return MAX_SQL_VARIABLES
+    
     def disconnect(self):
         """Close database connection."""
+        self._duplicate_filters.clear()
+        self._schema_cache.clear()
         if self.conn:
             self.conn.close()
             logger.info("Database connection closed")
@@ -76,13 +615,7 @@ class InstrumentCSVImporter:
         Returns:
             Sanitized column name
         """
-        # Replace spaces and special characters with underscores
-        sanitized = name.strip().replace(' ', '_').replace('-', '_')
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in sanitized)
-        # Ensure it doesn't start with a number
-        if sanitized and sanitized[0].isdigit():
-            sanitized = 'col_' + sanitized
-        return sanitized.lower()
+        return _sanitize_identifier(name)
     
     def infer_column_type(self, value: str) -> str:
         """
@@ -111,15 +644,37 @@ class InstrumentCSVImporter:
         
         return 'TEXT'
     
+    def infer_sample_type(self, values: List[str]) -> str:
+        """
+        Infer SQL data type from a column's sample values.
+        
+        Empty values are ignored, so a blank leading cell does not make the
+        whole column TEXT.
+        
+        Args:
+            values: Sample values from one CSV column
+            
+        Returns:
+            SQL data type (TEXT, INTEGER, or REAL)
+        """
+        types = {self.infer_column_type(value) for value in set(values) if value.strip()}
+        if not types:
+            return 'TEXT'
+        if len(types) == 1:
+            return types.pop()
+        if types <= {'INTEGER', 'REAL'}:
+            return 'REAL'
+        return 'TEXT'
+    
     def create_table(self, table_name: str, headers: List[str], 
-                    sample_row: List[str]) -> str:
+                    sample_rows: List[List[str]]) -> str:
         """
         Create table if it doesn't exist.
         
         Args:
             table_name: Name of the table to create
             headers: Column headers from CSV
-            sample_row: First data row for type inference
+            sample_rows: Leading data rows for type inference
             
         Returns:
             Sanitized table name
@@ -128,12 +683,13 @@ class InstrumentCSVImporter:
         
         # Create column definitions
         columns = []
-        columns.append("id INTEGER PRIMARY KEY AUTOINCREMENT")
+        # Plain rowid alias: AUTOINCREMENT would update sqlite_sequence per row
+        columns.append("id INTEGER PRIMARY KEY")
         
         for i, header in enumerate(headers):
             col_name = self.sanitize_column_name(header)
-            col_type = self.infer_column_type(sample_row[i] if i < len(sample_row) else '')
-            columns.append(f"{col_name} {col_type}")
+            col_type = self.infer_sample_type([row[i] for row in sample_rows if i < len(row)])
+            columns.append(f"{_quote_identifier(col_name)} {col_type}")
         
         # Add metadata columns
         columns.append("import_timestamp TEXT DEFAULT CURRENT_TIMESTAMP")
@@ -141,23 +697,241 @@ class InstrumentCSVImporter:
         
         # Create table
         create_sql = f"""
-        CREATE TABLE IF NOT EXISTS {sanitized_table} (
+        CREATE TABLE IF NOT EXISTS {_quote_identifier(sanitized_table)} (
             {', '.join(columns)}
         )
         """
         
         try:
             self.cursor.execute(create_sql)
-            self.conn.commit()
             logger.info(f"Table '{sanitized_table}' created or verified")
-        except sqlite3.Error as e:
+        except _DB_ERRORS as e:
             logger.error(f"Failed to create table: {e}")
             raise
         
         return sanitized_table
     
+    def create_indexes(self, table_name: str, columns: List[str]):
+        """
+        Create single-column indexes if they don't exist.
+        
+        Args:
+            table_name: Sanitized table name
+            columns: Names of the columns to index
+            
+        Raises:
+            ValueError: If a column is not in the table
+        """
+        # SQLite reads an unknown quoted name as a string literal, which
+        # would index a constant, so check the names first
+        self.cursor.execute(f"PRAGMA table_info({_quote_identifier(table_name)})")
+        table_columns = {row[1] for row in self.cursor.fetchall()}
+        col_names = [self.sanitize_column_name(column) for column in columns]
+        unknown = [name for name in col_names if name not in table_columns]
+        if unknown:
+            raise ValueError(f"No such column in '{table_name}': {', '.join(unknown)}")
+        
+        for col_name in col_names:
+            index_sql = f"""
+            CREATE INDEX IF NOT EXISTS {_quote_identifier(f"idx_{table_name}_{col_name}")}
+            ON {_quote_identifier(table_name)} ({_quote_identifier(col_name)})
+            """
+            
+            try:
+                self.cursor.execute(index_sql)
+                logger.info(f"Index on '{table_name}.{col_name}' created or verified")
+            except _DB_ERRORS as e:
+                logger.error(f"Failed to create index: {e}")
+                raise
+    
+    def _insert_batch(self, insert_sql: str, multi_insert_sql: str,
+                      row_group: int, batch: List[List[str]]):
+        """
+        Insert a batch of rows, row_group rows per statement.
+        
+        Args:
+            insert_sql: Single-row INSERT statement
+            multi_insert_sql: INSERT statement with row_group VALUES tuples
+            row_group: Number of rows bound by multi_insert_sql
+            batch: Rows to insert
+        """
+        # One iterator over the batch feeds both statements, so no slices of
+        # the batch are copied; executemany consumes the remainder directly
+        rows = iter(batch)
+        for _ in range(len(batch) // row_group):
+            self.cursor.execute(multi_insert_sql,
+                                list(chain.from_iterable(islice(rows, row_group))))
+        if len(batch) % row_group:
+            self.cursor.executemany(insert_sql, rows)
+    
+    def _write_batch(self, insert_sql: str, multi_insert_sql: str, row_group: int,
+                     batch: List[List[str]], stats: Dict[str, Any]):
+        """
+        Insert a batch of rows and record the outcome in stats.
+        
+        Args:
+            insert_sql: Single-row INSERT statement
+            multi_insert_sql: INSERT statement with row_group VALUES tuples
+            row_group: Number of rows bound by multi_insert_sql
+            batch: Rows to insert
+            stats: Import statistics to update
+        """
+        if not batch:
+            return
+        try:
+            self.cursor.execute("SAVEPOINT batch")
+            self._insert_batch(insert_sql, multi_insert_sql, row_group, batch)
+            self.cursor.execute("RELEASE batch")
+            stats['imported_rows'] += len(batch)
+            return
+        except _DB_ERRORS as e:
+            # Some errors (disk full, I/O errors) abort the whole transaction,
+            # taking the file's earlier batches with it; fail the import
+            if not self.conn.in_transaction:
+                raise
+            logger.warning(f"Batch insert failed at row {stats['total_rows']}, "
+                           f"retrying row by row: {e}")
+            self.cursor.execute("ROLLBACK TO batch")
+            self.cursor.execute("RELEASE batch")
+        
+        # Insert rows one at a time so only the failing ones are lost
+        for row in batch:
+            try:
+                self.cursor.execute(insert_sql, row)
+                stats['imported_rows'] += 1
+            except _DB_ERRORS as e:
+                if not self.conn.in_transaction:
+                    raise
+                logger.error(f"Row insert failed: {e}")
+                stats['error_rows'] += 1
+    
+    def _get_duplicate_filter(self, table: str, columns: List[str], csv_path: str,
+                              sample_rows: List[List[str]]) -> _DuplicateFilter:
+        """
+        Get the duplicate filter for a table, building it if needed.
+        
+        Filters are kept for the session and rebuilt when a file is likely
+        to push one past its capacity.
+        
+        Args:
+            table: Sanitized table name
+            columns: Sanitized column names of the file
+            csv_path: Path to the CSV file about to be imported
+            sample_rows: Leading data rows, used to estimate the row count
+            
+        Returns:
+            Duplicate filter with its skipped count reset
+        """
+        sample_bytes = sum(len(','.join(row)) + 1 for row in sample_rows)
+        expected_rows = os.path.getsize(csv_path) * len(sample_rows) // max(sample_bytes, 1)
+        key = (table, tuple(columns))
+        duplicates = self._duplicate_filters.get(key)
+        # Filters for the table under other columns won't see this file's
+        # rows, so they go stale
+        self._discard_duplicate_filters(table)
+        if duplicates is None or \
+                duplicates.bloom.count + expected_rows > duplicates.bloom.capacity:
+            duplicates = _DuplicateFilter(self.conn, table, columns, expected_rows)
+        self._duplicate_filters[key] = duplicates
+        duplicates.skipped = 0
+        return duplicates
+    
+    def _discard_duplicate_filters(self, table: str):
+        """Drop the cached duplicate filters of a table."""
+        for key in [key for key in self._duplicate_filters if key[0] == table]:
+            del self._duplicate_filters[key]
+    
+    def _try_bulk_import(self, csv_path: str, table: str, columns: List[str],
+                         stats: Dict[str, Any]) -> bool:
+        """
+        Load a CSV file through SQLite's csv virtual table.
+        
+        Only used for clean files (plain ASCII, no quoting in the first
+        BULK_SCAN_BYTES) and when the csv extension can be loaded; the file
+        is then parsed by SQLite without any per-row Python work.
+        
+        Args:
+            csv_path: Path to CSV file
+            table: Sanitized table name
+            columns: Sanitized column names, in file order
+            stats: Import statistics to update
+            
+        Returns:
+            True if the file was loaded, False to fall back to Python parsing
+        """
+        with open(csv_path, 'rb') as f:
+            head = f.read(BULK_SCAN_BYTES)
+        if head.startswith(codecs.BOM_UTF8):
+            head = head[len(codecs.BOM_UTF8):]
+        if _UNCLEAN_CSV_BYTES.search(head):
+            return False
+        
+        if self._csv_extension_loaded is None:
+            try:
+                self.conn.enable_load_extension(True)
+                self.conn.load_extension('csv')
+                self._csv_extension_loaded = True
+            except (AttributeError, *_DB_ERRORS) as e:
+                logger.info(f"SQLite csv extension unavailable, using Python parser: {e}")
+                self._csv_extension_loaded = False
+            finally:
+                # Don't leave extension loading enabled if the load failed;
+                # some sqlite3 builds lack the method altogether
+                try:
+                    self.conn.enable_load_extension(False)
+                except AttributeError:
+                    pass
+        if not self._csv_extension_loaded:
+            return False
+        
+        # Missing trailing fields come back as NULL; store them as '' like
+        # the Python path. The schema fixes the column count; giving columns=
+        # as well would stop the header line from being skipped
+        fields = [f"c{i}" for i in range(len(columns))]
+        values = [f"COALESCE({field}, '')" for field in fields]
+        schema = f"CREATE TABLE x({', '.join(fields)})"
+        quoted_table = _quote_identifier(table)
+        
+        try:
+            self.cursor.execute(f"""
+            CREATE VIRTUAL TABLE temp.csv_source USING csv(
+                filename={_quote_literal(csv_path)}, header=YES,
+                schema={_quote_literal(schema)}
+            )
+            """)
+            try:
+                # Load every row in one pass over the file, then delete the
+                # rows with no values at all from the newly inserted range
+                self.cursor.execute(f"SELECT max(rowid) FROM {quoted_table}")
+                last_rowid = self.cursor.fetchone()[0] or 0
+                self.cursor.execute(f"""
+                INSERT INTO {quoted_table}
+                ({', '.join(map(_quote_identifier, columns))}, source_file)
+                SELECT {', '.join(values)}, ?
+                FROM temp.csv_source
+                """, (os.path.basename(csv_path),))
+                total_rows = self.cursor.execute("SELECT changes()").fetchone()[0]
+                self.cursor.execute(f"""
+                DELETE FROM {quoted_table}
+                WHERE rowid > ? AND {' || '.join(map(_quote_identifier, columns))} = ''
+                """, (last_rowid,))
+                imported_rows = total_rows - self.cursor.execute(
+                    "SELECT changes()").fetchone()[0]
+            finally:
+                self.cursor.execute("DROP TABLE temp.csv_source")
+        except _DB_ERRORS as e:
+            logger.warning(f"Bulk import failed, using Python parser: {e}")
+            return False
+        
+        stats['total_rows'] += total_rows
+        stats['imported_rows'] += imported_rows
+        stats['skipped_rows'] += total_rows - imported_rows
+        logger.info(f"Bulk imported {imported_rows} rows via SQLite csv extension")
+        return True
+    
     def import_csv(self, csv_path: str, table_name: Optional[str] = None,
-                   skip_duplicates: bool = True) -> Dict[str, Any]:
+                   skip_duplicates: bool = True,
+                   indexes: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Import CSV file into database.
         
@@ -165,6 +939,7 @@ class InstrumentCSVImporter:
             csv_path: Path to CSV file
             table_name: Name for database table (default: filename)
             skip_duplicates: Skip duplicate rows if True
+            indexes: Columns to index once the data is loaded
             
         Returns:
             Dictionary with import statistics
@@ -186,81 +961,121 @@ class InstrumentCSVImporter:
         logger.info(f"Starting import from: {csv_path}")
         
         try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as csvfile:
-                # Read CSV
-                csv_reader = csv.reader(csvfile)
+            # A 1 MB read buffer cuts read() calls on large files
+            with open(csv_path, 'rb', buffering=READ_BUFFER_SIZE) as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8-sig', newline='') as csvfile:
+                # Read CSV; lines without quoting skip the csv module's parser
+                csv_reader = _block_csv_reader(csvfile)
                 headers = next(csv_reader)
                 
-                # Get first data row for type inference
-                first_row = next(csv_reader, None)
-                if first_row is None:
+                # Sample leading data rows for type inference, then put them
+                # back in front of the remaining rows
+                sample_rows = list(islice(csv_reader, TYPE_SAMPLE_ROWS))
+                if not sample_rows:
                     logger.warning("CSV file is empty")
                     return stats
+                csv_reader = chain(sample_rows, csv_reader)
                 
-                # Create table
-                sanitized_table = self.create_table(table_name, headers, first_row)
-                sanitized_headers = [self.sanitize_column_name(h) for h in headers]
+                # Create the table and prepare its insert statements, once per
+                # table and header layout for this connection
+                schema_key = (table_name, tuple(headers))
+                schema = self._schema_cache.get(schema_key)
+                if schema is None:
+                    sanitized_table = self.create_table(table_name, headers, sample_rows)
+                    sanitized_headers = [self.sanitize_column_name(h) for h in headers]
+                    
+                    # Multi-row VALUES for whole groups of rows, single-row for
+                    # the remainder of each batch. The source file is filled in
+                    # as a literal per file, so rows don't carry it as a value
+                    row_values = f"({', '.join(['?' for _ in sanitized_headers])}, {{src}})"
+                    row_group = max(1, min(ROWS_PER_INSERT,
+                                           self.max_sql_variables // len(sanitized_headers)))
+                    insert_sql = f"""
+                    INSERT INTO {_quote_identifier(sanitized_table)} 
+                    ({', '.join(map(_quote_identifier, sanitized_headers))}, source_file)
+                    VALUES {row_values}
+                    """
+                    multi_insert_sql = insert_sql.replace(
+                        row_values, ', '.join([row_values] * row_group))
+                    schema = (sanitized_table, sanitized_headers, row_group,
+                              insert_sql, multi_insert_sql)
+                    self._schema_cache[schema_key] = schema
+                sanitized_table, sanitized_headers, row_group, insert_sql, multi_insert_sql = schema
+                src = _quote_literal(os.path.basename(csv_path))
+                insert_sql = insert_sql.replace('{src}', src)
+                multi_insert_sql = multi_insert_sql.replace('{src}', src)
                 
-                # Prepare insert statement
-                placeholders = ', '.join(['?' for _ in sanitized_headers])
-                insert_sql = f"""
-                INSERT INTO {sanitized_table} 
-                ({', '.join(sanitized_headers)}, source_file)
-                VALUES ({placeholders}, ?)
-                """
+                # Import data in batches within a single transaction
+                self.cursor.execute("BEGIN IMMEDIATE")
                 
-                # Import data in batches
-                batch = []
+                # Progress is logged at most every PROGRESS_LOG_INTERVAL seconds
+                log_progress = logger.isEnabledFor(logging.INFO)
+                last_log = time.monotonic()
                 
-                # Process first row
-                batch.append(first_row + [os.path.basename(csv_path)])
-                stats['total_rows'] += 1
+                # Duplicate detection keeps a filter of the table's rows
+                duplicates = None
+                if skip_duplicates:
+                    duplicates = self._get_duplicate_filter(
+                        sanitized_table, sanitized_headers, csv_path, sample_rows)
+                else:
+                    self._discard_duplicate_filters(sanitized_table)
                 
-                # Process remaining rows
-                for row_num, row in enumerate(csv_reader, start=2):
-                    stats['total_rows'] += 1
-                    
-                    # Skip empty rows
-                    if not any(row):
-                        stats['skipped_rows'] += 1
-                        continue
-                    
-                    # Pad row if necessary
-                    while len(row) < len(headers):
-                        row.append('')
-                    
-                    # Truncate if too long
-                    row = row[:len(headers)]
-                    
-                    batch.append(row + [os.path.basename(csv_path)])
-                    
-                    # Execute batch insert
-                    if len(batch) >= self.batch_size:
-                        try:
-                            self.cursor.executemany(insert_sql, batch)
-                            self.conn.commit()
-                            stats['imported_rows'] += len(batch)
+                # Let SQLite parse clean files itself, bypassing the loop below;
+                # it cannot check for duplicates
+                bulk_loaded = not skip_duplicates and self._try_bulk_import(
+                    csv_path, sanitized_table, sanitized_headers, stats)
+                
+                # With more than one CPU, parse batches on a background thread
+                # while this one inserts them; only this thread touches the
+                # database
+                batches = _read_batches(iter(()) if bulk_loaded else csv_reader,
+                                        self.batch_size, len(headers))
+                if not bulk_loaded and (os.cpu_count() or 1) > 1:
+                    batches = _prefetch(batches, PREFETCH_BATCHES)
+                with closing(batches):
+                    for batch, rows_read, empty_rows in batches:
+                        stats['total_rows'] += rows_read
+                        stats['skipped_rows'] += empty_rows
+                        
+                        # Execute batch insert
+                        if duplicates is not None:
+                            batch = duplicates.filter(batch)
+                        self._write_batch(insert_sql, multi_insert_sql, row_group, batch, stats)
+                        if log_progress and time.monotonic() - last_log >= PROGRESS_LOG_INTERVAL:
                             logger.info(f"Imported {stats['imported_rows']} rows...")
-                            batch = []
-                        except sqlite3.Error as e:
-                            logger.error(f"Batch insert failed at row {row_num}: {e}")
-                            stats['error_rows'] += len(batch)
-                            batch = []
+                            last_log = time.monotonic()
+                        
+                        # Verify possible duplicates once enough are held back
+                        if duplicates is not None and \
+                                len(duplicates.candidates) >= DEDUP_VERIFY_ROWS:
+                            self._write_batch(insert_sql, multi_insert_sql, row_group,
+                                              duplicates.verify(), stats)
                 
-                # Insert remaining rows
-                if batch:
-                    try:
-                        self.cursor.executemany(insert_sql, batch)
-                        self.conn.commit()
-                        stats['imported_rows'] += len(batch)
-                    except sqlite3.Error as e:
-                        logger.error(f"Final batch insert failed: {e}")
-                        stats['error_rows'] += len(batch)
+                # Insert held back rows that turn out not to be duplicates
+                if duplicates is not None:
+                    self._write_batch(insert_sql, multi_insert_sql, row_group,
+                                      duplicates.verify(), stats)
+                    stats['skipped_rows'] += duplicates.skipped
+                
+                if self.conn.in_transaction:
+                    self.cursor.execute("COMMIT")
                 
         except Exception as e:
             logger.error(f"Import failed: {e}")
+            if self.conn.in_transaction:
+                self.cursor.execute("ROLLBACK")
+            # Filters may hold rows that were rolled back
+            self._discard_duplicate_filters(self.sanitize_column_name(table_name))
             raise
         
+        # Index after loading, so inserts don't maintain the indexes. The
+        # rows are committed by now, so a failure doesn't fail the import
+        if indexes:
+            try:
+                self.create_indexes(sanitized_table, indexes)
+            except (ValueError, *_DB_ERRORS) as e:
+                logger.error(f"Indexing failed after import: {e}")
+        
         logger.info(f"Import complete - Total: {stats['total_rows']}, "
                    f"Imported: {stats['imported_rows']}, "
                    f"Skipped: {stats['skipped_rows']}, "
@@ -268,13 +1083,142 @@ class InstrumentCSVImporter:
         
         return stats
     
-    def import_directory(self, dir_path: str, pattern: str = "*.csv") -> Dict[str, Any]:
+    def _import_sharded(self, csv_files: List[Path],
+                        skip_duplicates: bool = True) -> List[Dict[str, Any]]:
+        """
+        Import files in worker processes, then merge their shards.
+        
+        SQLite allows a single writer, so each worker imports its share of
+        the files into a shard database of its own; the shards are then
+        merged into this database one at a time.
+        
+        Args:
+            csv_files: CSV files to import
+            skip_duplicates: Skip duplicate rows if True
+            
+        Returns:
+            Import statistics for each successfully imported file
+        """
+        workers = min(self.workers, len(csv_files))
+        groups = [[str(f) for f in csv_files[i::workers]] for i in range(workers)]
+        db_dir = os.path.dirname(os.path.abspath(self.db_path))
+        file_stats = []
+        
+        logger.info(f"Importing {len(csv_files)} file(s) with {workers} workers")
+        
+        with tempfile.TemporaryDirectory(prefix='csv_import_', dir=db_dir) as shard_dir:
+            shards = [os.path.join(shard_dir, f"shard_{i}.db") for i in range(workers)]
+            
+            # Stop the log listener (flushing its queue) while the workers
+            # are forked, so no thread holds a handler's lock as they start
+            _log_listener.stop()
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_import_shard, type(self), shard, group,
+                                        self.batch_size, skip_duplicates, self.backend)
+                        for shard, group in zip(shards, groups)
+                    ]
+            finally:
+                _log_listener.start()
+            
+            for shard, future in zip(shards, futures):
+                try:
+                    shard_stats = future.result()
+                except Exception as e:
+                    logger.error(f"Worker for {shard} failed: {e}")
+                    continue
+                
+                try:
+                    skipped = self._merge_shard(shard, skip_duplicates)
+                except _DB_ERRORS as e:
+                    logger.error(f"Failed to merge {shard}: {e}")
+                    # Rows that never reached this database count as errors
+                    for stats in shard_stats:
+                        stats['error_rows'] += stats['imported_rows']
+                        stats['imported_rows'] = 0
+                else:
+                    # Rows already in this database were skipped by the merge
+                    for stats in shard_stats:
+                        moved = min(skipped, stats['imported_rows'])
+                        stats['imported_rows'] -= moved
+                        stats['skipped_rows'] += moved
+                        skipped -= moved
+                
+                file_stats.extend(shard_stats)
+        
+        return file_stats
+    
+    def _merge_shard(self, shard_path: str, skip_duplicates: bool = True) -> int:
+        """
+        Copy every table of a shard database into this database.
+        
+        Missing tables are created from the shard's schema; rows get new ids.
+        
+        Args:
+            shard_path: Path to shard database
+            skip_duplicates: Skip rows already present in this database
+            
+        Returns:
+            Number of duplicate rows skipped
+        """
+        skipped = 0
+        self.cursor.execute("ATTACH DATABASE ? AS shard", (shard_path,))
+        try:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self.cursor.execute(
+                    "SELECT name, sql FROM shard.sqlite_master "
+                    "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+                )
+                for table, create_sql in self.cursor.fetchall():
+                    self.cursor.execute(
+                        "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+                        (table,)
+                    )
+                    if self.cursor.fetchone() is None:
+                        self.cursor.execute(create_sql)
+                    
+                    quoted_table = _quote_identifier(table)
+                    self.cursor.execute(f"PRAGMA shard.table_info({quoted_table})")
+                    columns = [row[1] for row in self.cursor.fetchall() if row[1] != 'id']
+                    data_columns = ', '.join(
+                        _quote_identifier(c) for c in columns
+                        if c not in ('import_timestamp', 'source_file'))
+                    columns = ', '.join(map(_quote_identifier, columns))
+                    
+                    # Workers only saw their own shard, so compare with this
+                    # database too
+                    where = ''
+                    if skip_duplicates:
+                        where = (f"WHERE ({data_columns}) NOT IN "
+                                 f"(SELECT {data_columns} FROM main.{quoted_table})")
+                    self.cursor.execute(f"""
+                    INSERT INTO main.{quoted_table} ({columns})
+                    SELECT {columns} FROM shard.{quoted_table} {where} ORDER BY id
+                    """)
+                    merged = self.cursor.execute("SELECT changes()").fetchone()[0]
+                    self.cursor.execute(f"SELECT count(*) FROM shard.{quoted_table}")
+                    skipped += self.cursor.fetchone()[0] - merged
+                    self._discard_duplicate_filters(table)
+                self.cursor.execute("COMMIT")
+            except _DB_ERRORS:
+                self.cursor.execute("ROLLBACK")
+                raise
+        finally:
+            self.cursor.execute("DETACH DATABASE shard")
+        
+        return skipped
+    
+    def import_directory(self, dir_path: str, pattern: str = "*.csv",
+                         skip_duplicates: bool = True) -> Dict[str, Any]:
         """
         Import all CSV files from a directory.
         
         Args:
             dir_path: Path to directory containing CSV files
             pattern: File pattern to match (default: *.csv)
+            skip_duplicates: Skip duplicate rows if True
             
         Returns:
             Dictionary with aggregate statistics
@@ -295,16 +1239,23 @@ class InstrumentCSVImporter:
         
         logger.info(f"Found {len(csv_files)} CSV file(s) to process")
         
-        for csv_file in csv_files:
-            try:
-                stats = self.import_csv(str(csv_file))
-                total_stats['files_processed'] += 1
-                total_stats['total_rows'] += stats['total_rows']
-                total_stats['imported_rows'] += stats['imported_rows']
-                total_stats['skipped_rows'] += stats['skipped_rows']
-                total_stats['error_rows'] += stats['error_rows']
-            except Exception as e:
-                logger.error(f"Failed to import {csv_file}: {e}")
+        if self.workers > 1 and len(csv_files) > 1:
+            file_stats = self._import_sharded(csv_files, skip_duplicates)
+        else:
+            file_stats = []
+            for csv_file in csv_files:
+                try:
+                    file_stats.append(
+                        self.import_csv(str(csv_file), skip_duplicates=skip_duplicates))
+                except Exception as e:
+                    logger.error(f"Failed to import {csv_file}: {e}")
+        
+        for stats in file_stats:
+            total_stats['files_processed'] += 1
+            total_stats['total_rows'] += stats['total_rows']
+            total_stats['imported_rows'] += stats['imported_rows']
+            total_stats['skipped_rows'] += stats['skipped_rows']
+            total_stats['error_rows'] += stats['error_rows']
         
         logger.info(f"Directory import complete - Files: {total_stats['files_processed']}, "
                    f"Total rows: {total_stats['imported_rows']}")
@@ -312,6 +1263,54 @@ class InstrumentCSVImporter:
         return total_stats
 
 
+def _log_directly():
+    """
+    Write log records from a worker process without the listener thread.
+    
+    The worker gets handlers of its own rather than the ones it inherited
+    from the parent's listener.
+    """
+    root = logging.getLogger()
+    if not any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in _make_log_handlers():
+        root.addHandler(handler)
+
+
+def _import_shard(importer_class: type, shard_path: str, csv_paths: List[str],
+                  batch_size: int, skip_duplicates: bool,
+                  backend: str) -> List[Dict[str, Any]]:
+    """
+    Import CSV files into a shard database (runs in a worker process).
+    
+    Args:
+        importer_class: Importer class to instantiate
+        shard_path: Path to the shard database
+        csv_paths: CSV files to import
+        batch_size: Number of rows to insert per batch
+        skip_duplicates: Skip duplicate rows if True
+        backend: SQLite driver to use
+        
+    Returns:
+        Import statistics for each successfully imported file
+    """
+    _log_directly()
+    importer = importer_class(shard_path, batch_size, backend=backend)
+    file_stats = []
+    try:
+        importer.connect()
+        for csv_path in csv_paths:
+            try:
+                file_stats.append(importer.import_csv(csv_path, skip_duplicates=skip_duplicates))
+            except Exception as e:
+                logger.error(f"Failed to import {csv_path}: {e}")
+    finally:
+        importer.disconnect()
+    return file_stats
+
+
 def main():
     """Main entry point for command-line usage."""
     parser = argparse.ArgumentParser(
@@ -341,20 +1340,49 @@ def main():
         default='*.csv',
         help='File pattern for directory import (default: *.csv)'
     )
+    parser.add_argument(
+        '-i', '--index',
+        action='append',
+        metavar='COLUMN',
+        help='Column to index after a single-file import (repeatable)'
+    )
+    parser.add_argument(
+        '--allow-duplicates',
+        action='store_true',
+        help='Import rows even if identical rows are already in the table'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for directory import (default: 1)'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=['sqlite3', 'apsw'],
+        default='sqlite3',
+        help='SQLite driver; apsw must be installed (default: sqlite3)'
+    )
     
     args = parser.parse_args()
+    if args.backend == 'apsw' and apsw is None:
+        parser.error("--backend apsw requires the apsw package")
     
     # Initialize importer
-    importer = InstrumentCSVImporter(args.database, args.batch_size)
+    importer = InstrumentCSVImporter(args.database, args.batch_size, args.workers,
+                                     args.backend)
     
     try:
         importer.connect()
         
         # Check if input is file or directory
         if os.path.isfile(args.input):
-            stats = importer.import_csv(args.input, args.table)
+            stats = importer.import_csv(args.input, args.table,
+                                        skip_duplicates=not args.allow_duplicates,
+                                        indexes=args.index)
         elif os.path.isdir(args.input):
-            stats = importer.import_directory(args.input, args.pattern)
+            stats = importer.import_directory(args.input, args.pattern,
+                                              skip_duplicates=not args.allow_duplicates)
         else:
             logger.error(f"Input path not found: {args.input}")
             return 1